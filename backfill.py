@@ -0,0 +1,262 @@
+import argparse
+import json
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
+from pathlib import Path
+
+from fetcher import create_session, RateLimiter, fetch_url
+from models import Internship
+from pipeline import read_archive_ids
+from scraper import load_config, save_seen_internships, extract_stipend_range, parse_posting_time
+from sources import get_sources
+
+class BackfillStore:
+    """
+    Checkpoints and staged results of a bulk backfill crawl, in the shared
+    SQLite state db.
+
+    Every crawled page is committed in one transaction that stages all of its
+    cards and advances that listing's checkpoint, so a crawl killed at any
+    point resumes at exactly the next uncommitted page. When a listing is
+    finished its staged cards are moved to the JSON Lines archive; once every
+    listing of the crawl is finished the checkpoints are cleared, so the next
+    backfill crawls everything from page 1 again.
+    """
+
+    def __init__(self, db_path='data/state.db'):
+        Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(db_path, timeout=30, isolation_level=None, check_same_thread=False)
+        self.lock = threading.Lock()
+        self.inserted = 0
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS backfill_checkpoints ("
+            " listing_url TEXT PRIMARY KEY,"
+            " source TEXT NOT NULL,"
+            " category TEXT NOT NULL,"
+            " next_page INTEGER NOT NULL,"
+            " done INTEGER NOT NULL,"
+            " updated_at TEXT NOT NULL)"
+        )
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS backfill_records ("
+            " listing_url TEXT NOT NULL,"
+            " id TEXT NOT NULL,"
+            " data TEXT NOT NULL,"
+            " PRIMARY KEY (listing_url, id))"
+        )
+
+    def checkpoint(self, listing_url):
+        """Return (next_page, done) for a listing; a fresh listing starts at page 1"""
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT next_page, done FROM backfill_checkpoints WHERE listing_url = ?", (listing_url,)
+            ).fetchone()
+        return (row[0], bool(row[1])) if row else (1, False)
+
+    def commit_page(self, listing_url, source, category, next_page, records, done):
+        """Bulk-stage one page of records and advance the checkpoint atomically"""
+        now = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        with self.lock:
+            self.conn.execute("BEGIN IMMEDIATE")
+            try:
+                cursor = self.conn.executemany(
+                    "INSERT OR IGNORE INTO backfill_records (listing_url, id, data) VALUES (?, ?, ?)",
+                    [(listing_url, r.id, json.dumps(r.to_dict(), ensure_ascii=False)) for r in records],
+                )
+                self.conn.execute(
+                    "INSERT OR REPLACE INTO backfill_checkpoints"
+                    " (listing_url, source, category, next_page, done, updated_at) VALUES (?, ?, ?, ?, ?, ?)",
+                    (listing_url, source, category, next_page, int(done), now),
+                )
+                self.conn.execute("COMMIT")
+            except BaseException:
+                self.conn.execute("ROLLBACK")
+                raise
+            self.inserted += max(cursor.rowcount, 0)
+
+    def staged(self, listing_url=None):
+        """Return (id, JSON record) pairs staged for one listing, or for all listings"""
+        with self.lock:
+            if listing_url is None:
+                return self.conn.execute("SELECT id, data FROM backfill_records").fetchall()
+            return self.conn.execute(
+                "SELECT id, data FROM backfill_records WHERE listing_url = ?", (listing_url,)
+            ).fetchall()
+
+    def finish(self, listing_url):
+        """Drop a finished listing's staged records once they are archived"""
+        with self.lock:
+            self.conn.execute("DELETE FROM backfill_records WHERE listing_url = ?", (listing_url,))
+
+    def reset(self, listing_urls):
+        """Forget the checkpoints and staged records of these listings so they are crawled from page 1"""
+        with self.lock:
+            for url in listing_urls:
+                self.conn.execute("DELETE FROM backfill_records WHERE listing_url = ?", (url,))
+                self.conn.execute("DELETE FROM backfill_checkpoints WHERE listing_url = ?", (url,))
+
+    def close(self):
+        self.conn.close()
+
+class ArchiveWriter:
+    """
+    Appends backfilled records to the JSON Lines archive that ArchiveSink
+    writes, skipping IDs the archive already holds. Shared by the crawl threads.
+    """
+
+    def __init__(self, path='data/archive.jsonl'):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.lock = threading.Lock()
+        self.ids = read_archive_ids(self.path)
+
+    def write(self, rows):
+        """Append (id, JSON record) rows not archived yet; returns how many were written"""
+        with self.lock:
+            new_rows = [(internship_id, data) for internship_id, data in rows if internship_id not in self.ids]
+            if new_rows:
+                with open(self.path, 'a', encoding='utf-8') as f:
+                    f.writelines(data + '\n' for _, data in new_rows)
+                self.ids.update(internship_id for internship_id, _ in new_rows)
+            return len(new_rows)
+
+def finish_listing(category, listing_url, store, archive):
+    """
+    Move a finished listing's staged records to the archive and mark them as
+    seen. Safe to repeat after a crash part way.
+    """
+    rows = store.staged(listing_url)
+    written = archive.write(rows)
+    save_seen_internships([internship_id for internship_id, _ in rows])
+    store.finish(listing_url)
+    print(f"✅ {category}: {len(rows)} cards crawled, {written} new to the archive")
+
+def page_records(source, content, category, found_at):
+    """Parse every card on a listing page into records (no seen or preference filtering)"""
+    records = []
+    for card in source.find_cards(source.parse_page(content)):
+        try:
+            internship_id = source.posting_id(card)
+            internship_data = source.parse_card(card, category) if internship_id else None
+        except Exception:
+            continue
+        if not internship_data:
+            continue
+        internship_data['id'] = internship_id
+        stipend_min, stipend_max = extract_stipend_range(internship_data['stipend'])
+        days_old = parse_posting_time(internship_data['posting_time'])
+        records.append(Internship.from_card(internship_data, stipend_min, stipend_max, days_old, found_at))
+    return records
+
+def crawl_listing(source, category, listing_url, session, limiter, store, archive, max_pages, found_at):
+    """
+    Crawl one listing page by page from its checkpoint until it runs out of
+    cards, starts repeating the previous page, or reaches max_pages, then
+    move its cards to the archive.
+    """
+    next_page, done = store.checkpoint(listing_url)
+    if done:
+        if store.staged(listing_url):
+            # Crawled completely before, but interrupted before it was archived
+            finish_listing(category, listing_url, store, archive)
+        else:
+            print(f"⏭️ {category}: already complete in this crawl")
+        return
+    if next_page > 1:
+        print(f"↩️ {category}: resuming at page {next_page}")
+
+    previous_ids = None
+    page = next_page
+    while True:
+        url = source.page_url(listing_url, page) if page <= max_pages else None
+        if url is None:
+            # Page limit reached, or the source has no further pages
+            store.commit_page(listing_url, source.name, category, page, [], True)
+            break
+        records = page_records(source, fetch_url(session, limiter, url), category, found_at)
+        ids = {record.id for record in records}
+        # Past the last page the site serves nothing, or the last page again
+        finished = not records or ids == previous_ids
+        if finished:
+            records = []
+        store.commit_page(listing_url, source.name, category, page + 1, records, finished)
+        print(f"   📄 {category} page {page}: {len(records)} cards")
+        if finished:
+            break
+        previous_ids = ids
+        page += 1
+
+    finish_listing(category, listing_url, store, archive)
+
+def backfill(categories=None, max_pages=50, restart=False, db_path='data/state.db'):
+    """
+    Crawl every page of the chosen categories, append the whole inventory to
+    the archive and mark it as seen. Returns the number of cards crawled.
+    """
+    config = load_config()
+    if not config:
+        return 0
+
+    listings = []
+    for source in get_sources(config):
+        for category in source.categories(config):
+            if categories and category not in categories:
+                continue
+            for listing_url in source.listing_urls(category, config):
+                listings.append((source, category, listing_url))
+
+    if not listings:
+        print("⚠️ No matching categories to backfill")
+        return 0
+
+    store = BackfillStore(db_path)
+    if restart:
+        store.reset([listing_url for _, _, listing_url in listings])
+
+    print(f"🗃️ Backfilling {len(listings)} listing(s), up to {max_pages} pages each")
+    session = create_session()
+    limiter = RateLimiter(config.get('request_delay_seconds', 2))
+    found_at = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    archive = ArchiveWriter(config.get('archive_path', 'data/archive.jsonl'))
+
+    try:
+        with ThreadPoolExecutor(max_workers=config.get('max_concurrent_requests', 4)) as executor:
+            futures = {
+                executor.submit(crawl_listing, source, category, listing_url,
+                                session, limiter, store, archive, max_pages, found_at): category
+                for source, category, listing_url in listings
+            }
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                except Exception as e:
+                    print(f"❌ {futures[future]}: {e} (rerun to resume from the last checkpoint)")
+        listing_urls = [listing_url for _, _, listing_url in listings]
+        if all(store.checkpoint(url)[1] for url in listing_urls):
+            # Crawl complete: the next backfill starts a fresh one
+            store.reset(listing_urls)
+        else:
+            print("↩️ Some listings are unfinished: rerun to resume the crawl")
+    finally:
+        # Cards of unfinished listings stay staged for the resumed crawl, but are already known
+        staged = store.staged()
+        if staged:
+            save_seen_internships([internship_id for internship_id, _ in staged])
+        total = store.inserted
+        store.close()
+
+    print(f"\n📊 Backfill crawled {total} card(s) this run")
+    return total
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Resumable full-inventory backfill crawl")
+    parser.add_argument('--categories', nargs='*', default=None,
+                        help="Categories to backfill (default: all configured)")
+    parser.add_argument('--max-pages', type=int, default=50, help="Page limit per listing")
+    parser.add_argument('--restart', action='store_true', help="Discard an interrupted crawl's checkpoints and start from page 1")
+    parser.add_argument('--db', default='data/state.db', help="SQLite state database")
+    args = parser.parse_args()
+
+    backfill(args.categories, max_pages=args.max_pages, restart=args.restart, db_path=args.db)
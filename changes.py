@@ -0,0 +1,130 @@
+import hashlib
+import json
+import re
+
+from normalize import parse_duration, parse_stipend
+from state import atomic_write_json, file_lock
+
+FINGERPRINT_FILE = 'data/fingerprints.json'
+
+# Text that changes on every card without the posting itself changing
+_VOLATILE_TEXT = re.compile(
+    r'\d+\+?\s*(?:minute|hour|day|week|month)s?\s*ago|just now|few hours ago|today'
+    r'|be an early applicant|\d+\+?\s*applicants?'
+)
+
+def _digest(text):
+    return hashlib.blake2b(text.encode('utf-8'), digest_size=8).hexdigest()
+
+def card_fingerprint(source, card):
+    """
+    Cheap fingerprint of a card's raw text, with relative times and applicant
+    counts removed. Needs one text walk instead of running every selector.
+    """
+    text = ' '.join(source.card_text(card).lower().split())
+    return _digest(_VOLATILE_TEXT.sub('', text))
+
+def field_fingerprint(internship):
+    """Fingerprint of the normalized fields that matter to a subscriber"""
+    stipend = parse_stipend(internship['stipend'])
+    fields = [
+        ' '.join(internship['title'].lower().split()),
+        ' '.join(internship['company'].lower().split()),
+        ' '.join(internship['location'].lower().split()),
+        str(stipend.min), str(stipend.max), str(stipend.period),
+        str(parse_duration(internship['duration'])),
+    ]
+    return _digest('\x1f'.join(fields))
+
+def describe_change(previous, internship):
+    """Short human-readable summary of what changed since the stored fingerprint"""
+    changes = []
+    stipend = parse_stipend(internship['stipend'])
+    if previous[3] != stipend.min:
+        changes.append(f"stipend ₹{previous[3]:,} → ₹{stipend.min:,}")
+    if previous[4] != internship['location']:
+        changes.append(f"location {previous[4]} → {internship['location']}")
+    return ', '.join(changes) or "details changed"
+
+class ChangeTracker:
+    """
+    Per-posting fingerprints used to notice edits to already-seen postings.
+
+    Stores [card fingerprint, field fingerprint, meets preferences,
+    stipend_min, location, recent] per internship ID. Whether a posting meets
+    preferences is stored on its own, apart from whether it was recent enough,
+    so postings dropped for age keep an honest baseline. Seen cards whose card
+    fingerprint is unchanged are skipped without extraction; the rest are
+    re-extracted and, when their normalized fields changed so that they now
+    meet preferences for the first time, come back out of the pipeline as
+    "updated" events.
+    """
+
+    def __init__(self, path=FINGERPRINT_FILE):
+        self.path = path
+        self.entries = self._read()
+        self.pending = {}
+        self.updates = set()
+        self.dirty = {}
+
+    def _read(self):
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+        except json.JSONDecodeError:
+            print("⚠️ Warning: fingerprints.json is corrupted, starting fresh")
+            return {}
+
+    def note_new(self, internship_id, source, card):
+        """Remember the card fingerprint of an unseen card until it is resolved"""
+        self.pending[internship_id] = card_fingerprint(source, card)
+
+    def card_changed(self, internship_id, source, card):
+        """
+        Check a seen card. Returns True (and marks it as an update) when its
+        card fingerprint differs from the stored one or none is stored yet.
+        """
+        fingerprint = card_fingerprint(source, card)
+        previous = self.entries.get(internship_id)
+        if previous is not None and previous[0] == fingerprint:
+            return False
+        self.pending[internship_id] = fingerprint
+        self.updates.add(internship_id)
+        return True
+
+    def is_update(self, internship_id):
+        return internship_id in self.updates
+
+    def resolve(self, internship, meets_preferences, recent=True):
+        """
+        Store the fingerprints for a fully extracted card. For an update,
+        return a change summary if the edit makes it meet preferences for the
+        first time, otherwise None.
+        """
+        internship_id = internship['id']
+        previous = self.entries.get(internship_id)
+        fields = field_fingerprint(internship)
+        entry = [
+            self.pending.pop(internship_id, previous[0] if previous else None),
+            fields, meets_preferences, parse_stipend(internship['stipend']).min, internship['location'], recent,
+        ]
+        self.entries[internship_id] = self.dirty[internship_id] = entry
+
+        if internship_id not in self.updates or previous is None or len(previous) < 6:
+            # New posting, or a seen posting getting its first baseline (older
+            # entries mixed the age check into the stored match result)
+            return None
+        if previous[1] == fields or not meets_preferences or previous[2]:
+            return None
+        return describe_change(previous, internship)
+
+    def save(self):
+        """Merge this run's fingerprints into the file and replace it atomically"""
+        if not self.dirty:
+            return
+        with file_lock(self.path):
+            entries = self._read()
+            entries.update(self.dirty)
+            atomic_write_json(self.path, entries, indent=None)
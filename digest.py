@@ -0,0 +1,108 @@
+import json
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from email_sender import send_notification
+from latency import record_notified
+from state import atomic_write_json, file_lock
+
+PENDING_FILE = 'data/pending_digest.json'
+TIME_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+def score_internship(internship, config):
+    """Match score: how many preferred keywords appear in the title"""
+    title = internship['title'].lower()
+    return sum(1 for kw in config.get('keywords', []) if kw.lower().strip() in title)
+
+def in_quiet_hours(now, quiet_hours):
+    """Check whether `now` falls in a [start_hour, end_hour) window that may wrap midnight"""
+    if not quiet_hours:
+        return False
+    start, end = quiet_hours
+    if start <= end:
+        return start <= now.hour < end
+    return now.hour >= start or now.hour < end
+
+def load_pending(path=PENDING_FILE):
+    """Load the buffer of matches waiting for the next digest"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {'window_started': None, 'held_in_quiet_hours': False, 'items': []}
+    except json.JSONDecodeError:
+        print("⚠️ Warning: pending_digest.json is corrupted, starting fresh")
+        return {'window_started': None, 'held_in_quiet_hours': False, 'items': []}
+
+def flush_reason(pending, new_internships, config, now):
+    """Return why the buffer should be sent now, or None to keep accumulating"""
+    policy = config.get('digest', {})
+    if not pending['items']:
+        return None
+    if in_quiet_hours(now, policy.get('quiet_hours')):
+        return None
+    if pending['held_in_quiet_hours']:
+        return "quiet hours ended"
+
+    min_count = policy.get('immediate_min_count')
+    if min_count and len(new_internships) >= min_count:
+        return f"{len(new_internships)} new matches"
+
+    min_score = policy.get('immediate_min_score')
+    if min_score and any(score_internship(i, config) >= min_score for i in new_internships):
+        return "high-scoring match"
+
+    window = timedelta(minutes=policy.get('window_minutes', 360))
+    started = datetime.strptime(pending['window_started'], TIME_FORMAT)
+    if now - started >= window:
+        return "digest window elapsed"
+    return None
+
+def dispatch_notifications(new_internships, config, now=None, path=PENDING_FILE):
+    """
+    Send new matches according to the digest batching policy.
+
+    Without a "digest" section in config.json every run with matches sends one
+    email, as before. With it, matches are added to a persisted pending buffer
+    that is sent as one digest when a match clears the immediate thresholds,
+    when the window has elapsed, or on the first run after quiet hours. Nothing
+    is removed from the buffer unless the email was sent.
+
+    Returns 'sent', 'pending', 'failed' or 'empty'.
+    """
+    if not config.get('digest', {}).get('enabled', False):
+        if not new_internships:
+            return 'empty'
+        if not send_notification(new_internships):
+            return 'failed'
+        record_notified(new_internships)
+        return 'sent'
+
+    now = now or datetime.now()
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    with file_lock(path):
+        pending = load_pending(path)
+        if new_internships and not pending['items']:
+            pending['window_started'] = now.strftime(TIME_FORMAT)
+        pending['items'].extend(
+            i.to_dict() if hasattr(i, 'to_dict') else dict(i) for i in new_internships
+        )
+        if not pending['items']:
+            return 'empty'
+
+        reason = flush_reason(pending, new_internships, config, now)
+        if reason is None:
+            if in_quiet_hours(now, config['digest'].get('quiet_hours')):
+                pending['held_in_quiet_hours'] = True
+            atomic_write_json(path, pending)
+            print(f"🕐 Holding {len(pending['items'])} match(es) for the next digest")
+            return 'pending'
+
+        print(f"📬 Sending digest of {len(pending['items'])} match(es) ({reason})")
+        if not send_notification(pending['items']):
+            atomic_write_json(path, pending)
+            return 'failed'
+
+        atomic_write_json(path, {'window_started': None, 'held_in_quiet_hours': False, 'items': []})
+        record_notified(pending['items'])
+        return 'sent'
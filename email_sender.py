@@ -146,6 +146,19 @@ def send_notification(internships):
         duration = internship['duration']
         posting_time = internship.get('posting_time', 'Recently')
         link = internship['link']
+        notes = ""
+        if internship.get('repost_of'):
+            notes = """
+                        <div class="info-row">
+                            <span class="info-label">🔁 Note:</span>
+                            <span>Looks like a repost of an earlier listing</span>
+                        </div>"""
+        if internship.get('changes'):
+            notes += """
+                        <div class="info-row">
+                            <span class="info-label">🔄 Updated:</span>
+                            <span>{changes}</span>
+                        </div>""".format(changes=internship['changes'])
         
         body_html += """
                     <div class="internship-card">
@@ -169,11 +182,12 @@ def send_notification(internships):
                         <div class="info-row">
                             <span class="info-label">🕐 Posted:</span>
                             <span>{posting_time}</span>
-                        </div>
+                        </div>{notes}
                         <a href="{link}" class="apply-button">Apply Now →</a>
                     </div>
         """.format(title=title, company=company, location=location, 
-                   stipend=stipend, duration=duration, posting_time=posting_time, link=link)
+                   stipend=stipend, duration=duration, posting_time=posting_time,
+                   notes=notes, link=link)
     
     # Close HTML
     body_html += """
@@ -0,0 +1,127 @@
+import hashlib
+import json
+from datetime import datetime
+from email.utils import format_datetime
+from pathlib import Path
+from xml.sax.saxutils import escape
+
+from pipeline import Sink
+from state import atomic_write_text, file_lock
+
+TIME_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+def _parse_found_at(found_at):
+    """Turn a record's local found_at string into an aware datetime"""
+    return datetime.strptime(found_at, TIME_FORMAT).astimezone()
+
+def render_json_item(internship):
+    """Render one JSON Feed item (as a JSON string)"""
+    item = {
+        'id': str(internship['id']),
+        'url': internship['link'],
+        'title': f"{internship['title']} at {internship['company']}",
+        'content_text': f"{internship['location']} | {internship['stipend']} | {internship['duration']}",
+        'date_published': _parse_found_at(internship['found_at']).isoformat(),
+        'tags': [internship['category']],
+    }
+    return json.dumps(item, ensure_ascii=False)
+
+def render_rss_item(internship):
+    """Render one RSS <item> element"""
+    title = escape(f"{internship['title']} at {internship['company']}")
+    description = escape(f"{internship['location']} | {internship['stipend']} | {internship['duration']}")
+    return (
+        "    <item>\n"
+        f"      <title>{title}</title>\n"
+        f"      <link>{escape(internship['link'])}</link>\n"
+        f"      <guid isPermaLink=\"false\">{escape(str(internship['id']))}</guid>\n"
+        f"      <description>{description}</description>\n"
+        f"      <category>{escape(internship['category'])}</category>\n"
+        f"      <pubDate>{format_datetime(_parse_found_at(internship['found_at']))}</pubDate>\n"
+        "    </item>\n"
+    )
+
+class FeedSink(Sink):
+    """
+    Publishes matches as a static JSON Feed (feed.json) and RSS (feed.xml).
+
+    Each item is rendered once, when it is first added, and the rendered
+    fragments are kept in items.json next to the feeds. A run only renders its
+    new items, prepends them and trims the oldest, then rebuilds both files by
+    concatenating fragments. Files are replaced atomically and only when their
+    content changes, and each gets a .etag file holding a content hash, so
+    consumers can poll the files (or a static host) cheaply.
+    """
+
+    def __init__(self, directory='data/feed', max_items=200, title="Internshala Monitor",
+                 home_page_url="https://internshala.com/internships/"):
+        self.directory = Path(directory)
+        self.max_items = max_items
+        self.title = title
+        self.home_page_url = home_page_url
+        self.new_items = []
+
+    def add(self, internship):
+        self.new_items.append({
+            'id': str(internship['id']),
+            'json': render_json_item(internship),
+            'rss': render_rss_item(internship),
+            'published': internship['found_at'],
+        })
+
+    def close(self):
+        if not self.new_items:
+            return
+        self.directory.mkdir(parents=True, exist_ok=True)
+        items_path = self.directory / 'items.json'
+        with file_lock(items_path):
+            try:
+                with open(items_path, 'r', encoding='utf-8') as f:
+                    items = json.load(f)
+            except (FileNotFoundError, json.JSONDecodeError):
+                items = []
+
+            known = {item['id'] for item in items}
+            fresh = [item for item in reversed(self.new_items) if item['id'] not in known]
+            if not fresh:
+                return
+            items = (fresh + items)[:self.max_items]
+
+            atomic_write_text(items_path, json.dumps(items, ensure_ascii=False))
+            self._publish('feed.json', self._json_feed(items))
+            self._publish('feed.xml', self._rss_feed(items))
+        print(f"📰 Feed updated with {len(fresh)} new item(s)")
+
+    def _json_feed(self, items):
+        header = json.dumps({
+            'version': 'https://jsonfeed.org/version/1.1',
+            'title': self.title,
+            'home_page_url': self.home_page_url,
+        }, ensure_ascii=False)
+        return header[:-1] + ', "items": [\n' + ',\n'.join(item['json'] for item in items) + '\n]}\n'
+
+    def _rss_feed(self, items):
+        # lastBuildDate follows the newest item, so unchanged feeds stay byte-identical
+        last_build = format_datetime(_parse_found_at(items[0]['published'])) if items else ''
+        return (
+            '<?xml version="1.0" encoding="UTF-8"?>\n'
+            '<rss version="2.0">\n'
+            '  <channel>\n'
+            f'    <title>{escape(self.title)}</title>\n'
+            f'    <link>{escape(self.home_page_url)}</link>\n'
+            '    <description>New internships matching the monitor preferences</description>\n'
+            f'    <lastBuildDate>{last_build}</lastBuildDate>\n'
+            + ''.join(item['rss'] for item in items) +
+            '  </channel>\n'
+            '</rss>\n'
+        )
+
+    def _publish(self, name, text):
+        """Atomically replace a feed file and its .etag, unless nothing changed"""
+        path = self.directory / name
+        etag = '"' + hashlib.sha256(text.encode('utf-8')).hexdigest()[:32] + '"'
+        etag_path = self.directory / f"{name}.etag"
+        if path.exists() and etag_path.exists() and etag_path.read_text(encoding='utf-8').strip() == etag:
+            return
+        atomic_write_text(path, text)
+        atomic_write_text(etag_path, etag + '\n')
@@ -0,0 +1,106 @@
+import queue
+import threading
+import time
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.5',
+    'Accept-Encoding': 'gzip, deflate, br',
+    'Connection': 'keep-alive',
+    'Upgrade-Insecure-Requests': '1'
+}
+
+def create_session(headers=None, pool_size=8):
+    """Create a requests session whose connection pool is shared by every source"""
+    session = requests.Session()
+    session.headers.update(headers or DEFAULT_HEADERS)
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+class RateLimiter:
+    """Per-host politeness delay that is safe to share between worker threads"""
+
+    def __init__(self, min_interval):
+        self.min_interval = min_interval
+        self._next_slot = {}
+        self._lock = threading.Lock()
+
+    def wait(self, url):
+        """Block until the host of `url` may be requested again"""
+        host = urlparse(url).netloc
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot.get(host, now))
+            self._next_slot[host] = slot + self.min_interval
+        delay = slot - now
+        if delay > 0:
+            time.sleep(delay)
+
+def fetch_url(session, limiter, url, timeout=30):
+    """Fetch a single URL through the shared session and rate limiter"""
+    limiter.wait(url)
+    response = session.get(url, timeout=timeout)
+    response.raise_for_status()
+    return response.content
+
+def fetch_all(session, limiter, jobs, max_workers=4, queue_size=None):
+    """
+    Fetch jobs concurrently and yield (job, content, error) as each completes.
+
+    A job is any dict with a 'url' key; it is handed back untouched so callers
+    can carry the source and category along with it. `jobs` may be a lazy
+    iterator. Finished pages wait in a bounded queue, so a slow consumer makes
+    the workers block instead of piling pages up in memory.
+    """
+    jobs = iter(jobs)
+    jobs_lock = threading.Lock()
+    results = queue.Queue(maxsize=queue_size or max_workers)
+    stop = threading.Event()
+    done = object()
+
+    def put(item):
+        while not stop.is_set():
+            try:
+                results.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
+    def worker():
+        try:
+            while not stop.is_set():
+                with jobs_lock:
+                    job = next(jobs, None)
+                if job is None:
+                    break
+                try:
+                    put((job, fetch_url(session, limiter, job['url']), None))
+                except Exception as e:
+                    put((job, None, e))
+        finally:
+            put(done)
+
+    threads = [threading.Thread(target=worker, daemon=True) for _ in range(max_workers)]
+    for thread in threads:
+        thread.start()
+
+    try:
+        finished = 0
+        while finished < len(threads):
+            item = results.get()
+            if item is done:
+                finished += 1
+                continue
+            yield item
+    finally:
+        # Consumer stopped early or finished: release any blocked workers
+        stop.set()
+        for thread in threads:
+            thread.join()
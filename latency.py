@@ -0,0 +1,141 @@
+import json
+import math
+from datetime import datetime, timedelta
+
+from normalize import parse_posting_age
+from pipeline import Sink
+from state import atomic_write_json, file_lock
+
+LATENCY_FILE = 'data/latency.json'
+TIME_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+def load_latency(path=LATENCY_FILE):
+    """Load per-posting freshness timestamps, keyed by internship ID"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+    except json.JSONDecodeError:
+        print("⚠️ Warning: latency.json is corrupted, starting fresh")
+        return {}
+
+def update_latency(updates, path=LATENCY_FILE, keep_days=30):
+    """Merge field updates into the saved records and drop records older than keep_days"""
+    if not updates:
+        return
+    cutoff = (datetime.now() - timedelta(days=keep_days)).strftime(TIME_FORMAT)
+    with file_lock(path):
+        records = load_latency(path)
+        for internship_id, fields in updates.items():
+            records.setdefault(internship_id, {}).update(fields)
+        # Records stamped only at send time (e.g. digest items first seen before
+        # the last prune) have no first_seen, so they age out by notified_at
+        records = {iid: r for iid, r in records.items()
+                   if (r.get('first_seen') or r.get('notified_at') or cutoff) >= cutoff}
+        atomic_write_json(path, records, indent=None)
+
+def estimate_posted_at(internship):
+    """
+    Best available posting time from the listing: first-seen time minus the
+    relative age on the card ("2 days ago"). Returns None when the age is unknown.
+    """
+    hours = parse_posting_age(internship['posting_time'])
+    if hours is None:
+        return None
+    first_seen = datetime.strptime(internship['found_at'], TIME_FORMAT)
+    return (first_seen - timedelta(hours=hours)).strftime(TIME_FORMAT)
+
+class LatencySink(Sink):
+    """
+    Records first-seen and posting time for every match as it is parsed.
+    With a fetch function, the posting's detail page is fetched and its
+    structured datePosted replaces the coarse listing estimate when present.
+    `sources` maps source names to adapters, which parse the detail pages.
+    """
+
+    def __init__(self, path=LATENCY_FILE, sources=None, fetch=None):
+        self.path = path
+        self.sources = sources or {}
+        self.fetch = fetch
+        self.updates = {}
+
+    def add(self, internship):
+        if internship.get('changes'):
+            # An edited posting was first seen (and timed) in an earlier run
+            return
+        posted_at, posted_source = estimate_posted_at(internship), 'listing'
+        source = self.sources.get(internship['source'])
+        if self.fetch and source and internship['link']:
+            try:
+                detail_posted_at = source.posted_at_from_detail(self.fetch(internship['link']))
+            except Exception:
+                detail_posted_at = None
+            if detail_posted_at:
+                posted_at, posted_source = detail_posted_at.strftime(TIME_FORMAT), 'detail'
+
+        self.updates[str(internship['id'])] = {
+            'category': internship['category'],
+            'first_seen': internship['found_at'],
+            'posted_at': posted_at,
+            'posted_source': posted_source,
+        }
+
+    def close(self):
+        update_latency(self.updates, self.path)
+
+def record_notified(internships, sent_at=None, path=LATENCY_FILE):
+    """Stamp the notification send time on every internship in a sent email"""
+    sent_at = (sent_at or datetime.now()).strftime(TIME_FORMAT)
+    update_latency({str(i['id']): {'notified_at': sent_at} for i in internships}, path)
+
+def percentile(values, pct):
+    """Nearest-rank percentile of a non-empty list"""
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+def _hours_between(start, end):
+    return (datetime.strptime(end, TIME_FORMAT) - datetime.strptime(start, TIME_FORMAT)).total_seconds() / 3600
+
+def latency_report(records):
+    """
+    Per-category p50/p95 latencies in hours:
+    posted -> notified (end to end), posted -> first seen (polling) and
+    first seen -> notified (pipeline and batching).
+    """
+    per_category = {}
+    for record in records.values():
+        if not record.get('notified_at') or not record.get('first_seen'):
+            continue
+        samples = per_category.setdefault(record.get('category', 'unknown'), {
+            'posted_to_notified': [], 'posted_to_seen': [], 'seen_to_notified': [],
+        })
+        samples['seen_to_notified'].append(_hours_between(record['first_seen'], record['notified_at']))
+        if record.get('posted_at'):
+            samples['posted_to_notified'].append(_hours_between(record['posted_at'], record['notified_at']))
+            samples['posted_to_seen'].append(_hours_between(record['posted_at'], record['first_seen']))
+
+    report = {}
+    for category, samples in per_category.items():
+        report[category] = {'count': len(samples['seen_to_notified'])}
+        for name, values in samples.items():
+            if values:
+                report[category][name] = (percentile(values, 50), percentile(values, 95))
+    return report
+
+def print_latency_report(path=LATENCY_FILE):
+    """Print the freshness report for every notified posting on record"""
+    report = latency_report(load_latency(path))
+    if not report:
+        print("ℹ️ No notified postings recorded yet")
+        return
+    print("⏱️ Freshness latency in hours (p50 / p95):")
+    for category, row in sorted(report.items()):
+        def cell(name):
+            return f"{row[name][0]:6.1f} / {row[name][1]:6.1f}" if name in row else "     n/a       "
+        print(f"   {category:<28} n={row['count']:<4} posted→notified {cell('posted_to_notified')} | "
+              f"posted→seen {cell('posted_to_seen')} | seen→notified {cell('seen_to_notified')}")
+
+if __name__ == "__main__":
+    print_latency_report()
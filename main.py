@@ -1,8 +1,21 @@
 from scraper import scrape_internshala, load_config
-from email_sender import send_notification
+from digest import dispatch_notifications
+from latency import print_latency_report
+import argparse
+import os
+import socket
 import sys
 
-def main():
+def parse_args():
+    """Parse command line options"""
+    parser = argparse.ArgumentParser(description="Internshala internship monitor")
+    parser.add_argument('--worker', action='store_true',
+                        help="Run as a lease-based worker that only scrapes categories it wins")
+    parser.add_argument('--worker-id', default=None,
+                        help="Worker name used for leases (default: <hostname>-<pid>)")
+    return parser.parse_args()
+
+def main(worker_id=None):
     """Main orchestrator for the Internshala monitor system"""
     print("=" * 60)
     print("🔍 INTERNSHALA INTERNSHIP MONITOR")
@@ -22,9 +35,11 @@ def main():
     
     # Scrape for new internships
     print("🔍 Starting internship search...")
-    new_internships = scrape_internshala()
+    if worker_id:
+        print(f"👷 Worker mode: {worker_id}")
+    new_internships = scrape_internshala(worker_id=worker_id)
     
-    # Send notification if new internships found
+    # Display summary of new internships
     if new_internships:
         print()
         print("=" * 60)
@@ -32,7 +47,6 @@ def main():
         print("=" * 60)
         print()
         
-        # Display summary
         print("📊 Summary of new internships:")
         for idx, internship in enumerate(new_internships, 1):
             print(f"{idx}. {internship['title']} at {internship['company']}")
@@ -40,20 +54,28 @@ def main():
         
         print()
         print("📧 Sending email notification...")
-        
-        success = send_notification(new_internships)
-        
-        if success:
-            print()
-            print("=" * 60)
-            print("✅ ALL DONE! Email notification sent successfully.")
-            print("=" * 60)
-        else:
-            print()
-            print("=" * 60)
-            print("⚠️ Warning: Internships found but email failed to send.")
-            print("   Check your .env configuration.")
-            print("=" * 60)
+    
+    # Send now or hold for a digest, depending on the batching policy
+    status = dispatch_notifications(new_internships, config)
+    
+    if status == 'sent':
+        print()
+        print("=" * 60)
+        print("✅ ALL DONE! Email notification sent successfully.")
+        print("=" * 60)
+        print()
+        print_latency_report()
+    elif status == 'failed':
+        print()
+        print("=" * 60)
+        print("⚠️ Warning: Internships found but email failed to send.")
+        print("   Check your .env configuration.")
+        print("=" * 60)
+    elif status == 'pending':
+        print()
+        print("=" * 60)
+        print("🕐 Matches queued for the next digest email.")
+        print("=" * 60)
     else:
         print()
         print("=" * 60)
@@ -65,8 +87,13 @@ def main():
     print("Monitor run completed.")
 
 if __name__ == "__main__":
+    args = parse_args()
+    worker_id = None
+    if args.worker:
+        worker_id = args.worker_id or f"{socket.gethostname()}-{os.getpid()}"
+    
     try:
-        main()
+        main(worker_id)
     except KeyboardInterrupt:
         print("\n\n⚠️ Interrupted by user. Exiting...")
         sys.exit(0)
@@ -0,0 +1,77 @@
+import sys
+from dataclasses import dataclass, fields
+
+@dataclass(slots=True)
+class Internship:
+    """
+    Compact record for one matched internship.
+
+    Uses __slots__ instead of a per-instance dict, stores numeric fields as
+    ints, interns strings that repeat across thousands of cards (category,
+    location, source, duration) and shares one run timestamp string between
+    all records of a run. Supports read-only dict-style access so code written
+    against the old per-card dicts keeps working.
+    """
+    id: str
+    title: str
+    company: str
+    location: str
+    stipend: str
+    stipend_min: int
+    stipend_max: int
+    duration: str
+    posting_time: str
+    days_old: int
+    link: str
+    category: str
+    source: str
+    found_at: str
+    repost_of: str = None
+    changes: str = None
+
+    @classmethod
+    def from_card(cls, card, stipend_min, stipend_max, days_old, found_at):
+        """Build a record from an adapter's card dict plus derived fields"""
+        return cls(
+            id=card['id'],
+            title=card['title'],
+            company=card['company'],
+            location=sys.intern(card['location']),
+            stipend=card['stipend'],
+            stipend_min=stipend_min,
+            stipend_max=stipend_max,
+            duration=sys.intern(card['duration']),
+            posting_time=card['posting_time'],
+            days_old=days_old,
+            link=card['link'],
+            category=sys.intern(card['category']),
+            source=sys.intern(card.get('source', 'internshala')),
+            found_at=found_at,
+        )
+
+    @property
+    def stipend_amount(self):
+        """Lower bound of the stipend, as the old dicts reported it"""
+        return self.stipend_min
+
+    def keys(self):
+        return [f.name for f in fields(self)] + ['stipend_amount']
+
+    def __getitem__(self, key):
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def __contains__(self, key):
+        return key in self.keys()
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def to_dict(self):
+        """Return a plain dict view (e.g. for JSON serialisation)"""
+        return {key: self[key] for key in self.keys()}
@@ -0,0 +1,196 @@
+"""
+Memoized, table-driven parsers for the free-text fields on listing cards.
+
+The same handful of strings ("₹ 10,000 /month", "2 days ago", "3 Months")
+repeat thousands of times in a large crawl, so every parser is wrapped in an
+LRU cache and only the first occurrence of a string pays for the regexes.
+
+Run `python normalize.py` to check the parsers against a generated corpus and
+print per-call timings.
+"""
+import re
+from collections import namedtuple
+from functools import lru_cache
+
+CACHE_SIZE = 4096
+
+Stipend = namedtuple('Stipend', ['min', 'max', 'period', 'currency'])
+UNPAID = Stipend(0, 0, None, None)
+
+_NUMBER = re.compile(r'\d[\d,]*')
+
+# (pattern, value) tables, checked in order; the first match wins
+_STIPEND_PERIODS = [
+    (re.compile(r'/\s*month|per month|month'), 'month'),
+    (re.compile(r'/\s*week|per week|week'), 'week'),
+    (re.compile(r'/\s*year|per annum|year|lpa'), 'year'),
+    (re.compile(r'lump\s*sum'), 'lump_sum'),
+]
+_CURRENCIES = [
+    (re.compile(r'₹|\binr\b|\brs\.?'), 'INR'),
+    (re.compile(r'\$|\busd\b'), 'USD'),
+    (re.compile(r'€|\beur\b'), 'EUR'),
+]
+# (pattern, months per unit)
+_DURATION_UNITS = [
+    (re.compile(r'(\d+(?:\.\d+)?)\s*month'), 1),
+    (re.compile(r'(\d+(?:\.\d+)?)\s*week'), 7 / 30),
+    (re.compile(r'(\d+(?:\.\d+)?)\s*day'), 1 / 30),
+    (re.compile(r'(\d+(?:\.\d+)?)\s*year'), 12),
+]
+# (pattern, hours per unit); a pattern without a number counts as one unit,
+# and an open-ended count like "30+ days" counts as its lower bound
+_AGE_UNITS = [
+    (re.compile(r'just now|today|few (?:hours|minutes)|minute|second'), 0),
+    (re.compile(r'(\d+)?\+?\s*hour'), 1),
+    (re.compile(r'(\d+)?\+?\s*day'), 24),
+    (re.compile(r'(\d+)?\+?\s*week'), 24 * 7),
+    (re.compile(r'(\d+)?\+?\s*month'), 24 * 30),
+]
+
+def _lookup(table, text, default=None):
+    for pattern, value in table:
+        if pattern.search(text):
+            return value
+    return default
+
+@lru_cache(maxsize=CACHE_SIZE)
+def parse_stipend(stipend_text):
+    """
+    Parse stipend text into Stipend(min, max, period, currency).
+    '₹ 5,000-10,000 /month' -> Stipend(5000, 10000, 'month', 'INR').
+    Unpaid, undisclosed or number-less text gives Stipend(0, 0, None, None).
+    """
+    if not stipend_text:
+        return UNPAID
+    text = stipend_text.lower()
+    if 'not' in text or 'unpaid' in text:
+        return UNPAID
+
+    amounts = [int(number.replace(',', '')) for number in _NUMBER.findall(text)]
+    if not amounts:
+        return UNPAID
+
+    low, high = amounts[0], max(amounts[:2])
+    return Stipend(low, high, _lookup(_STIPEND_PERIODS, text, 'month'), _lookup(_CURRENCIES, text, 'INR'))
+
+@lru_cache(maxsize=CACHE_SIZE)
+def parse_duration(duration_text):
+    """Parse duration text like '3 Months' or '6 Weeks' into months, or None"""
+    if not duration_text:
+        return None
+    text = duration_text.lower()
+    for pattern, months_per_unit in _DURATION_UNITS:
+        match = pattern.search(text)
+        if match:
+            return round(float(match.group(1)) * months_per_unit, 2)
+    return None
+
+@lru_cache(maxsize=CACHE_SIZE)
+def parse_posting_age(time_text):
+    """Parse relative posting time like '2 days ago' into hours, or None if unknown"""
+    if not time_text:
+        return None
+    text = time_text.lower().strip()
+    for pattern, hours_per_unit in _AGE_UNITS:
+        match = pattern.search(text)
+        if match:
+            count = match.group(1) if pattern.groups else None
+            return (int(count) if count else 1) * hours_per_unit
+    return None
+
+@lru_cache(maxsize=CACHE_SIZE)
+def posting_age_days(time_text):
+    """
+    Days-old value used by the recency filter.
+    Anything under a day (including "today") counts as 0, and month-old or
+    unparseable text as 999 (too old).
+    """
+    if time_text and 'month' in time_text.lower():
+        return 999
+    hours = parse_posting_age(time_text)
+    if hours is None:
+        return 999
+    return hours // 24
+
+def cache_info():
+    """Hit/miss counters of every parser cache, keyed by parser name"""
+    return {parser.__name__: parser.cache_info()
+            for parser in (parse_stipend, parse_duration, parse_posting_age, posting_age_days)}
+
+def _corpus(size=2000, seed=7):
+    """Generate realistic card strings, with the repetition a real crawl has"""
+    import random
+    rng = random.Random(seed)
+    amounts = [1000, 2000, 2500, 5000, 7500, 8000, 10000, 12000, 15000, 20000, 25000, 50000]
+    stipends, durations, ages = [], [], []
+    for _ in range(size):
+        low = rng.choice(amounts)
+        high = low + rng.choice([0, 0, 2000, 5000, 10000])
+        amount = f"{low:,}" if high == low else f"{low:,}-{high:,}"
+        stipends.append(rng.choice([
+            f"₹ {amount} /month", f"₹ {amount} /week", f"₹ {amount} lump sum",
+            f"₹ {amount} /month +  Incentives", "Unpaid", "Not disclosed", "Performance Based",
+        ]))
+        durations.append(rng.choice([f"{rng.randint(1, 12)} Months", f"{rng.randint(1, 12)} Weeks", "1 Month"]))
+        ages.append(rng.choice([
+            "Just now", "Few hours ago", f"{rng.randint(1, 23)} hours ago", "Today",
+            f"{rng.randint(1, 6)} days ago", "1 day ago", f"{rng.randint(1, 4)} weeks ago", "1 month ago",
+            "30+ days ago",
+        ]))
+    return stipends, durations, ages
+
+def _check_properties(stipends, durations, ages):
+    """Invariants every parser result must satisfy"""
+    for text in stipends:
+        result = parse_stipend(text)
+        assert 0 <= result.min <= result.max, text
+        assert (result.min == 0) == (result.period is None), text
+        assert parse_stipend.__wrapped__(text) == result, text
+    assert parse_stipend("₹ 5,000-10,000 /month") == Stipend(5000, 10000, 'month', 'INR')
+    assert parse_stipend("₹ 10,000 /month") == Stipend(10000, 10000, 'month', 'INR')
+
+    for text in durations:
+        months = parse_duration(text)
+        assert months is not None and months > 0, text
+    assert parse_duration("3 Months") == 3
+
+    for text in ages:
+        hours = parse_posting_age(text)
+        assert hours is not None and hours >= 0, text
+        days = posting_age_days(text)
+        assert days == (999 if 'month' in text.lower() else hours // 24), text
+    assert posting_age_days("2 days ago") == 2
+    assert posting_age_days("1 week ago") == 7
+    assert posting_age_days("Just now") == 0
+    assert parse_posting_age("Today") == 0
+    assert parse_posting_age("30+ days ago") == 30 * 24
+    assert posting_age_days("30+ days ago") == 30
+    assert posting_age_days("Unknown") == 999
+
+def _benchmark(stipends, durations, ages, repeat=5):
+    """Print the per-call cost of each parser with a cold and a warm cache"""
+    import timeit
+    for parser, corpus in ((parse_stipend, stipends), (parse_duration, durations),
+                           (parse_posting_age, ages), (posting_age_days, ages)):
+        def uncached():
+            for text in corpus:
+                parser.__wrapped__(text)
+
+        def cached():
+            for text in corpus:
+                parser(text)
+
+        cold = min(timeit.repeat(uncached, number=1, repeat=repeat)) / len(corpus)
+        parser.cache_clear()
+        cached()  # warm up
+        warm = min(timeit.repeat(cached, number=1, repeat=repeat)) / len(corpus)
+        print(f"   {parser.__name__:<18} uncached {cold * 1e6:6.2f} µs/call | cached {warm * 1e6:6.2f} µs/call")
+
+if __name__ == "__main__":
+    print("🧪 Checking normalizers against a generated corpus...")
+    corpus = _corpus()
+    _check_properties(*corpus)
+    print(f"✅ {sum(len(c) for c in corpus)} strings passed")
+    print("⏱️ Per-call cost:")
+    _benchmark(*corpus)
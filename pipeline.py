@@ -0,0 +1,73 @@
+import json
+from pathlib import Path
+
+class Sink:
+    """
+    Receives matched internships one at a time as the pipeline produces them.
+    Subclasses override add() and, if they buffer anything, close().
+    """
+
+    def add(self, internship):
+        raise NotImplementedError
+
+    def close(self):
+        pass
+
+class NotificationBuffer(Sink):
+    """Collects matches for the notification sent at the end of the run"""
+
+    def __init__(self):
+        self.internships = []
+
+    def add(self, internship):
+        self.internships.append(internship)
+
+def read_archive_ids(path):
+    """IDs of every record already in a JSON Lines archive"""
+    ids = set()
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    ids.add(str(json.loads(line)['id']))
+                except (ValueError, KeyError, TypeError):
+                    continue
+    except FileNotFoundError:
+        pass
+    return ids
+
+class ArchiveSink(Sink):
+    """
+    Appends every match to a JSON Lines archive as soon as it is parsed.
+    Postings the archive already holds (e.g. re-parsed from snapshots without
+    being marked seen) are skipped, so each ID is archived once.
+    """
+
+    def __init__(self, path='data/archive.jsonl'):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.ids = read_archive_ids(self.path)
+        self._file = open(self.path, 'a', encoding='utf-8')
+
+    def add(self, internship):
+        if str(internship['id']) in self.ids:
+            return
+        self.ids.add(str(internship['id']))
+        self._file.write(json.dumps(internship.to_dict(), ensure_ascii=False) + '\n')
+        self._file.flush()
+
+    def close(self):
+        self._file.close()
+
+def run_pipeline(internships, sinks):
+    """Drain a stream of internships into every sink, returning the match count"""
+    count = 0
+    try:
+        for internship in internships:
+            count += 1
+            for sink in sinks:
+                sink.add(internship)
+    finally:
+        for sink in sinks:
+            sink.close()
+    return count
@@ -0,0 +1,154 @@
+import json
+import random
+import re
+import zlib
+from datetime import datetime, timedelta
+
+from state import atomic_write_json, file_lock
+
+INDEX_FILE = 'data/repost_index.json'
+TIME_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+NUM_HASHES = 64
+BANDS = 16
+ROWS = NUM_HASHES // BANDS
+_PRIME = (1 << 61) - 1
+# Fixed seed so signatures stay comparable across runs
+_rng = random.Random(20251115)
+_PERMUTATIONS = [(_rng.randrange(1, _PRIME), _rng.randrange(0, _PRIME)) for _ in range(NUM_HASHES)]
+
+def normalize_text(text):
+    """Lowercase, drop punctuation and collapse whitespace"""
+    return ' '.join(re.sub(r'[^a-z0-9]+', ' ', text.lower()).split())
+
+def posting_key(internship):
+    """
+    Fields a repost must repeat exactly: company, location and stipend.
+    Only the title is compared by similarity, and only within one key.
+    """
+    return '|'.join([
+        normalize_text(internship['company']),
+        normalize_text(internship['location']),
+        str(internship['stipend_amount']),
+    ])
+
+def shingles(text, size=3):
+    """Character shingles of a normalized string"""
+    if len(text) <= size:
+        return {text}
+    return {text[i:i + size] for i in range(len(text) - size + 1)}
+
+def jaccard(text_a, text_b):
+    """Exact Jaccard similarity of two strings' shingle sets"""
+    a, b = shingles(text_a), shingles(text_b)
+    return len(a & b) / len(a | b)
+
+def minhash(text):
+    """MinHash signature of a string's shingle set"""
+    hashed = [zlib.crc32(s.encode('utf-8')) for s in shingles(text)]
+    return [min((a * h + b) % _PRIME for h in hashed) for a, b in _PERMUTATIONS]
+
+def band_keys(key, signature):
+    """LSH bucket keys: similar titles under the same posting key share at least one with high probability"""
+    return [f"{key}:{band}:{zlib.crc32(repr(signature[band * ROWS:(band + 1) * ROWS]).encode())}"
+            for band in range(BANDS)]
+
+def read_entries(path):
+    """Load the saved index entries, keyed by internship ID"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+    except json.JSONDecodeError:
+        print("⚠️ Warning: repost_index.json is corrupted, starting fresh")
+        return {}
+
+class RepostIndex:
+    """
+    MinHash/LSH index of recently notified postings.
+
+    Each posting is stored with its posting key (company, location, stipend),
+    normalized title and title signature. Candidates for a new posting come
+    only from the LSH buckets it falls into, which are scoped to its posting
+    key, so a lookup does not scan the whole history. Candidates are then
+    confirmed by the exact title similarity, not the signature estimate.
+    Entries older than the repost window are dropped on save.
+    """
+
+    def __init__(self, path=INDEX_FILE, window_days=30, threshold=0.8):
+        self.path = path
+        self.window = timedelta(days=window_days)
+        self.threshold = threshold
+        self.entries = {}
+        self.buckets = {}
+        for internship_id, entry in read_entries(path).items():
+            # Entries written before titles were stored cannot be confirmed
+            if 'title' in entry:
+                self._insert(internship_id, entry)
+
+    def _insert(self, internship_id, entry):
+        self.entries[internship_id] = entry
+        for bucket in band_keys(entry['key'], entry['sig']):
+            self.buckets.setdefault(bucket, []).append(internship_id)
+
+    def find_repost(self, internship, signature, now=None):
+        """Return the ID of an earlier posting this one repeats within the window, or None"""
+        now = now or datetime.now()
+        key, title = posting_key(internship), normalize_text(internship['title'])
+        best_id, best_score = None, self.threshold
+        candidates = {cid for bucket in band_keys(key, signature) for cid in self.buckets.get(bucket, ())}
+        for candidate_id in candidates:
+            if candidate_id == internship['id']:
+                continue
+            entry = self.entries[candidate_id]
+            # Bucket keys are hashed, so recheck the exact fields
+            if entry['key'] != key:
+                continue
+            if now - datetime.strptime(entry['first_seen'], TIME_FORMAT) > self.window:
+                continue
+            score = jaccard(title, entry['title'])
+            if score >= best_score:
+                best_id, best_score = candidate_id, score
+        return best_id
+
+    def add(self, internship, signature, now=None):
+        """Record a posting so later reposts of it can be found"""
+        if internship['id'] in self.entries:
+            return
+        now = now or datetime.now()
+        self._insert(internship['id'], {
+            'key': posting_key(internship),
+            'title': normalize_text(internship['title']),
+            'sig': signature,
+            'first_seen': now.strftime(TIME_FORMAT),
+        })
+
+    def save(self, now=None):
+        """Drop entries outside the window and atomically write the rest"""
+        now = now or datetime.now()
+        cutoff = (now - self.window).strftime(TIME_FORMAT)
+        with file_lock(self.path):
+            # Keep entries other workers saved since this index was loaded
+            merged = {**read_entries(self.path), **self.entries}
+            fresh = {iid: e for iid, e in merged.items() if 'title' in e and e['first_seen'] >= cutoff}
+            atomic_write_json(self.path, fresh, indent=None)
+
+def repost_stage(internships, index, action='flag'):
+    """
+    Check each match against the repost index.
+    Reposts are dropped ('suppress') or passed on with repost_of set ('flag').
+    Every match is added to the index so chains of reposts are caught too.
+    """
+    for internship in internships:
+        signature = minhash(normalize_text(internship['title']))
+        original_id = index.find_repost(internship, signature)
+        index.add(internship, signature)
+        if original_id is None:
+            yield internship
+            continue
+
+        print(f"  🔁 Repost of {original_id}: {internship['title']} at {internship['company']}")
+        if action == 'flag':
+            internship.repost_of = original_id
+            yield internship
@@ -0,0 +1,69 @@
+import json
+import random
+
+from state import atomic_write_json, file_lock
+
+STATS_FILE = 'data/category_stats.json'
+
+def shard_key(source_name, category):
+    return f"{source_name}:{category}"
+
+def load_category_stats(path=STATS_FILE):
+    """Load per-category yield statistics from earlier runs"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+    except json.JSONDecodeError:
+        print("⚠️ Warning: category_stats.json is corrupted, starting fresh")
+        return {}
+
+def category_yield(entry, prior_matches=1.0, prior_requests=2.0):
+    """
+    New matches per request, smoothed towards a prior so a category with one
+    lucky or unlucky request is not ranked on that alone.
+    """
+    entry = entry or {}
+    return (entry.get('matches', 0) + prior_matches) / (entry.get('requests', 0) + prior_requests)
+
+def prioritize_shards(shards, stats, explore_rate=0.1, rng=None):
+    """
+    Order (source, category) pairs highest-yield first.
+    With probability explore_rate the least-requested category is moved to the
+    front instead, so cold categories still get re-measured now and then.
+    """
+    rng = rng or random.Random()
+    ordered = sorted(
+        shards,
+        key=lambda shard: category_yield(stats.get(shard_key(shard[0].name, shard[1]))),
+        reverse=True,
+    )
+    if len(ordered) > 1 and rng.random() < explore_rate:
+        coldest = min(ordered, key=lambda shard: stats.get(shard_key(shard[0].name, shard[1]), {}).get('requests', 0))
+        ordered.remove(coldest)
+        ordered.insert(0, coldest)
+        print(f"🧭 Exploring cold category first: {coldest[1]}")
+    return ordered
+
+def update_category_stats(run_stats, decay=0.9, path=STATS_FILE):
+    """
+    Fold this run's per-category requests, fetched pages and matches into the
+    saved stats. Older runs are decayed so the ranking follows how categories
+    behave now. `run_stats` is the run Counter, keyed by ('requests', key) for
+    every fetch attempt, ('pages', key) for successful fetches and
+    ('matches', key).
+    """
+    attempted = {key for (kind, key) in (k for k in run_stats if isinstance(k, tuple)) if kind == 'requests'}
+    if not attempted:
+        return
+    with file_lock(path):
+        stats = load_category_stats(path)
+        for key in attempted:
+            entry = stats.get(key, {'requests': 0, 'matches': 0, 'runs': 0})
+            entry['requests'] = round(entry['requests'] * decay + run_stats['requests', key], 3)
+            entry['pages'] = round(entry.get('pages', 0) * decay + run_stats['pages', key], 3)
+            entry['matches'] = round(entry['matches'] * decay + run_stats['matches', key], 3)
+            entry['runs'] += 1
+            stats[key] = entry
+        atomic_write_json(path, stats)
@@ -1,11 +1,24 @@
-import requests
-from bs4 import BeautifulSoup
 import json
-import os
-import re
+import time
+from collections import Counter
 from datetime import datetime
 from pathlib import Path
 
+from fetcher import create_session, RateLimiter, fetch_all, fetch_url
+from sources import InternshalaSource, get_sources
+from changes import ChangeTracker
+from feed import FeedSink
+from latency import LatencySink
+from pipeline import NotificationBuffer, ArchiveSink, run_pipeline
+from snapshots import SnapshotStore
+from models import Internship
+from normalize import parse_stipend, posting_age_days
+from reposts import RepostIndex, repost_stage
+from scheduling import load_category_stats, prioritize_shards, shard_key, update_category_stats
+from state import LeaseStore, atomic_write_json, file_lock
+
+SEEN_FILE = 'data/seen_internships.json'
+
 def load_config():
     """Load configuration from config.json"""
     try:
@@ -24,7 +37,7 @@ def load_seen_internships():
         # Create data directory if it doesn't exist
         Path('data').mkdir(exist_ok=True)
         
-        with open('data/seen_internships.json', 'r', encoding='utf-8') as f:
+        with open(SEEN_FILE, 'r', encoding='utf-8') as f:
             return json.load(f)
     except FileNotFoundError:
         return []
@@ -33,27 +46,28 @@ def load_seen_internships():
         return []
 
 def save_seen_internships(internships):
-    """Save seen internship IDs to file"""
+    """
+    Save seen internship IDs to file.
+    The file is locked, merged with whatever other runs saved meanwhile and
+    replaced atomically, so overlapping runs never lose IDs or corrupt it.
+    """
     try:
         Path('data').mkdir(exist_ok=True)
-        with open('data/seen_internships.json', 'w', encoding='utf-8') as f:
-            json.dump(internships, f, indent=2)
+        with file_lock(SEEN_FILE):
+            merged = dict.fromkeys(load_seen_internships())
+            merged.update(dict.fromkeys(internships))
+            atomic_write_json(SEEN_FILE, list(merged))
     except Exception as e:
         print(f"❌ Error saving seen internships: {e}")
 
 def extract_stipend_amount(stipend_text):
-    """Extract numeric stipend amount from text like '₹ 5,000 /month'"""
-    if not stipend_text or 'not' in stipend_text.lower() or 'unpaid' in stipend_text.lower():
-        return 0
-    
-    # Extract numbers and remove commas
-    numbers = re.findall(r'[\d,]+', stipend_text.replace(',', ''))
-    if numbers:
-        try:
-            return int(numbers[0])
-        except ValueError:
-            return 0
-    return 0
+    """Extract numeric stipend amount (the lower bound) from text like '₹ 5,000 /month'"""
+    return parse_stipend(stipend_text).min
+
+def extract_stipend_range(stipend_text):
+    """Extract (min, max) stipend amounts from text like '₹ 5,000-10,000 /month'"""
+    stipend = parse_stipend(stipend_text)
+    return stipend.min, stipend.max
 
 def parse_posting_time(time_text):
     """
@@ -65,35 +79,7 @@ def parse_posting_time(time_text):
         - Number of weeks * 7 for "X weeks ago"
         - 999 for anything older or unparseable
     """
-    if not time_text:
-        return 999
-    
-    time_text = time_text.lower().strip()
-    
-    # Just now or few hours ago - consider as today (0 days)
-    if 'just now' in time_text or 'few hours ago' in time_text or 'hour' in time_text:
-        return 0
-    
-    # Extract days
-    if 'day' in time_text:
-        match = re.search(r'(\d+)\s*day', time_text)
-        if match:
-            return int(match.group(1))
-        return 1  # "1 day ago" or just "day ago"
-    
-    # Extract weeks
-    if 'week' in time_text:
-        match = re.search(r'(\d+)\s*week', time_text)
-        if match:
-            return int(match.group(1)) * 7
-        return 7  # "1 week ago" or just "week ago"
-    
-    # Extract months - treat as too old
-    if 'month' in time_text:
-        return 999
-    
-    # Unknown format - treat as too old
-    return 999
+    return posting_age_days(time_text)
 
 def is_recent_posting(time_text, max_days_old):
     """Check if posting is within the specified number of days"""
@@ -135,260 +121,355 @@ def matches_preferences(internship_data, config):
     
     return True
 
-def scrape_category(category, headers, config, seen_ids):
-    """Scrape a specific internship category"""
-    url = f"https://internshala.com/internships/{category}-internship/"
-    new_internships = []
-    
+def iter_fetch_jobs(shards, config, leases=None, worker_id=None, deadline=None, held=None, seen_ids=None):
+    """
+    Yield every (source, category, url) listing page to fetch this run.
+    In worker mode each category is leased just before its pages are handed
+    to the fetcher, so workers started together split the categories between
+    them and any number of processes or machines can share the work. `held`
+    receives the number of pages queued under each lease, for release_stage.
+    After each lease is taken, IDs other workers saved since `seen_ids` was
+    loaded are merged into it, so a category another worker just finished is
+    not reported again.
+    Once the monotonic `deadline` passes, no further categories are started.
+    """
+    # Only a safety net for crashed workers: leases are released as soon as
+    # their category has been processed
+    ttl = config.get('lease_seconds', 900)
+    held = held if held is not None else {}
+    queued_urls = set()
+    for index, (source, category) in enumerate(shards):
+        if deadline is not None and time.monotonic() >= deadline:
+            print(f"⏱️ Run budget used up, skipping {len(shards) - index} remaining categories")
+            return
+        lease = None
+        if leases is not None:
+            lease = f"{source.name}:{category}"
+            if not leases.acquire(lease, worker_id, ttl):
+                continue
+            print(f"   🔒 Leased {source.name}: {category}")
+            if seen_ids is not None:
+                known = set(seen_ids)
+                # A single extend, so the pipeline thread never sees a half-merged list
+                seen_ids.extend([iid for iid in load_seen_internships() if iid not in known])
+        urls = []
+        for url in source.listing_urls(category, config):
+            # Overlapping filters can produce the same listing URL twice
+            if url not in queued_urls:
+                queued_urls.add(url)
+                urls.append(url)
+        if lease is not None:
+            if not urls:
+                leases.release(lease, worker_id)
+                continue
+            held[lease] = len(urls)
+        for url in urls:
+            yield {'source': source, 'category': category, 'url': url, 'lease': lease}
+
+def release_stage(pages, leases, worker_id, held, seen_ids):
+    """
+    Give each category's lease back once all of its pages have been through
+    the pipeline. A page is done when the stages after this one ask for the
+    next page, since they handle one page's cards completely before that.
+    The seen-store is saved before each release, so the next worker to lease
+    the category already knows its postings.
+    """
+    for job, content, error in pages:
+        yield job, content, error
+        lease = job.get('lease')
+        if lease is None:
+            continue
+        held[lease] -= 1
+        if not held[lease]:
+            del held[lease]
+            save_seen_internships(seen_ids)
+            leases.release(lease, worker_id)
+
+def report_fetch_savings(stats, config, path='data/filter_stats.json'):
+    """
+    Print how much was downloaded and parsed this run and compare it with the
+    last run in the other mode (server-side filters on vs. off).
+    """
+    mode = 'filtered' if config.get('server_side_filters', False) else 'broad'
+    other_mode = 'broad' if mode == 'filtered' else 'filtered'
+    kept = stats['matches'] / stats['cards'] * 100 if stats['cards'] else 0
+    print(f"📉 Fetch stats ({mode}): {stats['pages']} pages, {stats['bytes'] / 1024:.0f} KB, "
+          f"{stats['cards']} cards parsed, {stats['matches']} matched ({kept:.0f}% of parsed cards kept)")
+
     try:
-        print(f"📡 Fetching: {url}")
-        response = requests.get(url, headers=headers, timeout=30)
-        response.raise_for_status()
-        
-        soup = BeautifulSoup(response.content, 'html.parser')
-        
-        # Find all internship containers - trying multiple possible selectors
-        internship_containers = []
-        
-        # Try different selectors based on Internshala's structure
-        possible_selectors = [
-            ('div', {'class': 'individual_internship'}),
-            ('div', {'class': 'internship_meta'}),
-            ('div', {'id': re.compile(r'internship_')}),
-        ]
-        
-        for tag, attrs in possible_selectors:
-            internship_containers = soup.find_all(tag, attrs)
-            if internship_containers:
-                print(f"✅ Found {len(internship_containers)} internships in {category}")
-                break
-        
-        if not internship_containers:
-            print(f"⚠️ No internship containers found in {category}")
-            return new_internships
-        
-        for idx, internship in enumerate(internship_containers, 1):
+        with open(path, 'r', encoding='utf-8') as f:
+            history = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        history = {}
+
+    previous = history.get(other_mode)
+    if previous and previous.get('cards') and stats['cards']:
+        def change(now, before):
+            percent = (1 - now / before) * 100 if before else 0
+            return f"{percent:.0f}% fewer" if percent >= 0 else f"{-percent:.0f}% more"
+        print(f"   vs. last {other_mode} run: {change(stats['cards'], previous['cards'])} cards parsed, "
+              f"{change(stats['bytes'], previous.get('bytes', 0))} bytes downloaded")
+
+    history[mode] = {key: stats[key] for key in ('pages', 'bytes', 'cards', 'candidates', 'matches')}
+    try:
+        atomic_write_json(path, history)
+    except Exception as e:
+        print(f"⚠️ Warning: could not save fetch stats: {e}")
+
+def parse_stage(pages, stats=None):
+    """Parse fetched pages one at a time and yield (source, card, category)"""
+    stats = stats if stats is not None else Counter()
+    for job, content, error in pages:
+        source, category = job['source'], job['category']
+        key = shard_key(source.name, category)
+        # Failed fetches spend the time budget too, so they count as requests
+        stats['requests', key] += 1
+        if error:
+            print(f"❌ Network error for {category}: {error}")
+            continue
+
+        stats['pages'] += 1
+        stats['pages', key] += 1
+        stats['bytes'] += len(content)
+        try:
+            cards = source.find_cards(source.parse_page(content))
+        except Exception as e:
+            print(f"❌ Unexpected error for {category}: {e}")
+            continue
+
+        if not cards:
+            print(f"⚠️ No internship containers found in {category} ({source.name})")
+            continue
+
+        print(f"✅ Found {len(cards)} internships in {category} ({source.name})")
+        stats['cards'] += len(cards)
+        for card in cards:
+            yield source, card, category
+
+def dedupe_stage(cards, seen_ids, tracker=None):
+    """
+    Drop cards without an ID or whose ID is already in the seen-store.
+    With a change tracker, seen cards whose fingerprint changed are passed on
+    too, so edits to known postings can be detected.
+    """
+    for source, card, category in cards:
+        try:
+            internship_id = source.posting_id(card)
+        except Exception:
+            continue
+        if not internship_id:
+            continue
+        if internship_id not in seen_ids:
+            if tracker is not None:
+                tracker.note_new(internship_id, source, card)
+            yield source, card, category, internship_id
+        elif tracker is not None and tracker.card_changed(internship_id, source, card):
+            yield source, card, category, internship_id
+
+def extract_stage(cards):
+    """Extract the fields of each unseen card"""
+    for source, card, category, internship_id in cards:
+        try:
+            internship_data = source.parse_card(card, category)
+        except Exception:
+            continue
+        if internship_data:
+            internship_data['id'] = internship_id
+            yield internship_data
+
+def recency_stage(internships, config, seen_ids, tracker=None):
+    """Drop postings older than max_days_old and build records for the rest"""
+    max_days_old = config.get('max_days_old', 999)  # Default: accept all
+    # One timestamp shared by every record found in this run
+    now = datetime.now()
+    run_timestamp = now.strftime('%Y-%m-%d %H:%M:%S')
+    for internship_data in internships:
+        is_update = tracker is not None and tracker.is_update(internship_data['id'])
+        days_old = parse_posting_time(internship_data['posting_time'])
+        if internship_data.get('found_at'):
+            # Cards from a stored snapshot: the card's age is relative to when it was fetched
+            days_old += (now - datetime.strptime(internship_data['found_at'], '%Y-%m-%d %H:%M:%S')).days
+        # An edit to a known posting is news even if the posting itself is old
+        if days_old > max_days_old and not is_update:
+            # Mark as seen but don't include in results
+            seen_ids.append(internship_data['id'])
+            if tracker is not None:
+                # Baseline the preference result on its own, so a later edit is
+                # only news if it is what makes the posting meet preferences
+                stipend_min, stipend_max = extract_stipend_range(internship_data['stipend'])
+                internship = Internship.from_card(internship_data, stipend_min, stipend_max, days_old, run_timestamp)
+                tracker.resolve(internship, matches_preferences(internship, config), recent=False)
+            continue
+
+        stipend_min, stipend_max = extract_stipend_range(internship_data['stipend'])
+        found_at = internship_data.get('found_at') or run_timestamp
+        yield Internship.from_card(internship_data, stipend_min, stipend_max, days_old, found_at)
+
+def match_stage(internships, config, seen_ids, stats=None, tracker=None):
+    """
+    Mark every candidate as seen and yield only those matching preferences.
+    Edited postings are yielded, with `changes` set, only when the edit makes
+    them match for the first time.
+    """
+    stats = stats if stats is not None else Counter()
+    max_days_old = config.get('max_days_old', 999)
+    for internship_data in internships:
+        matched = matches_preferences(internship_data, config)
+        recent = internship_data.days_old <= max_days_old
+
+        if tracker is not None and tracker.is_update(internship_data['id']):
+            change = tracker.resolve(internship_data, matched, recent)
+            if change:
+                internship_data.changes = change
+                stats['updates'] += 1
+                print(f"  🔄 Updated: {internship_data['title']} at {internship_data['company']} ({change})")
+                yield internship_data
+            continue
+
+        seen_ids.append(internship_data['id'])
+        if tracker is not None:
+            tracker.resolve(internship_data, matched, recent)
+        stats['candidates'] += 1
+        if matched:
+            stats['matches'] += 1
+            stats['matches', shard_key(internship_data['source'], internship_data['category'])] += 1
+            print(f"  ✅ New: {internship_data['title']} at {internship_data['company']} - {internship_data['location']}")
+            yield internship_data
+
+def snapshot_stage(pages, store):
+    """Save every fetched page to the snapshot store before it is parsed"""
+    for job, content, error in pages:
+        if not error:
             try:
-                # Extract internship ID - try multiple attributes
-                internship_id = (
-                    internship.get('internshipid') or 
-                    internship.get('data-internship-id') or
-                    internship.get('id', '').replace('internship_', '')
-                )
-                
-                if not internship_id:
-                    # Try to extract from any link
-                    link = internship.find('a', href=True)
-                    if link and 'detail' in link['href']:
-                        internship_id = link['href'].split('/')[-1].split('?')[0]
-                
-                if not internship_id:
-                    continue
-                
-                if internship_id in seen_ids:
-                    continue
-                
-                # Extract title - try multiple selectors
-                title = None
-                title_selectors = [
-                    ('h3', {'class': re.compile(r'heading')}),
-                    ('h3', {}),
-                    ('h4', {'class': re.compile(r'profile|title')}),
-                    ('a', {'class': re.compile(r'view_detail')}),
-                ]
-                
-                for tag, attrs in title_selectors:
-                    title_elem = internship.find(tag, attrs)
-                    if title_elem:
-                        title = title_elem.get_text(strip=True)
-                        break
-                
-                if not title:
-                    continue
-                
-                # Extract company name
-                company = "Not specified"
-                company_selectors = [
-                    ('p', {'class': re.compile(r'company')}),
-                    ('div', {'class': re.compile(r'company')}),
-                    ('span', {'class': re.compile(r'company')}),
-                    ('a', {'class': re.compile(r'link_display_like_text')}),
-                ]
-                
-                for tag, attrs in company_selectors:
-                    company_elem = internship.find(tag, attrs)
-                    if company_elem:
-                        company = company_elem.get_text(strip=True)
-                        break
-                
-                # Extract location
-                location = "Location not specified"
-                location_selectors = [
-                    ('div', {'class': re.compile(r'location')}),
-                    ('span', {'class': re.compile(r'location')}),
-                    ('a', {'class': re.compile(r'location')}),
-                ]
-                
-                for tag, attrs in location_selectors:
-                    location_elem = internship.find(tag, attrs)
-                    if location_elem:
-                        location = location_elem.get_text(strip=True)
-                        break
-                
-                # Extract stipend
-                stipend_text = "Not disclosed"
-                stipend_selectors = [
-                    ('span', {'class': re.compile(r'stipend')}),
-                    ('div', {'class': re.compile(r'stipend')}),
-                ]
-                
-                for tag, attrs in stipend_selectors:
-                    stipend_elem = internship.find(tag, attrs)
-                    if stipend_elem:
-                        stipend_text = stipend_elem.get_text(strip=True)
-                        break
-                
-                stipend_amount = extract_stipend_amount(stipend_text)
-                
-                # Extract duration
-                duration = "Not specified"
-                duration_selectors = [
-                    ('div', {'class': re.compile(r'duration')}),
-                    ('span', {'class': re.compile(r'duration')}),
-                ]
-                
-                for tag, attrs in duration_selectors:
-                    duration_elem = internship.find(tag, attrs)
-                    if duration_elem:
-                        duration = duration_elem.get_text(strip=True)
-                        break
-                
-                # Extract posting time (IMPORTANT for recent filter)
-                posting_time = "Unknown"
-                days_old = 999
-                
-                # Look for posting time - usually appears near the end of the internship card
-                # Common patterns: "Just now", "Few hours ago", "2 days ago", "1 week ago"
-                posting_time_selectors = [
-                    ('span', {'class': re.compile(r'status-[a-z]+')}),  # status-success, etc.
-                    ('div', {'class': re.compile(r'status')}),
-                    ('span', {}),  # Generic span, will look for time patterns
-                    ('div', {}),   # Generic div, will look for time patterns
-                ]
-                
-                # Try to find posting time text
-                for tag, attrs in posting_time_selectors:
-                    time_elems = internship.find_all(tag, attrs, limit=20)
-                    for elem in time_elems:
-                        text = elem.get_text(strip=True).lower()
-                        # Check if this contains time-related keywords
-                        if any(keyword in text for keyword in ['ago', 'just now', 'hour', 'day', 'week', 'month']):
-                            # Exclude "early applicant" text
-                            if 'early applicant' not in text and 'be an early' not in text:
-                                posting_time = elem.get_text(strip=True)
-                                days_old = parse_posting_time(posting_time)
-                                break
-                    if posting_time != "Unknown":
-                        break
-                
-                # Check if internship meets recency criteria
-                max_days_old = config.get('max_days_old', 999)  # Default: accept all
-                if days_old > max_days_old:
-                    # Mark as seen but don't include in results
-                    seen_ids.append(internship_id)
-                    continue
-                
-                # Extract apply link
-                apply_link = ""
-                link_elem = internship.find('a', href=True)
-                if link_elem:
-                    href = link_elem['href']
-                    if href.startswith('http'):
-                        apply_link = href
-                    else:
-                        apply_link = f"https://internshala.com{href}" if href.startswith('/') else f"https://internshala.com/{href}"
-                
-                # Create internship data object
-                internship_data = {
-                    'id': internship_id,
-                    'title': title,
-                    'company': company,
-                    'location': location,
-                    'stipend': stipend_text,
-                    'stipend_amount': stipend_amount,
-                    'duration': duration,
-                    'posting_time': posting_time,
-                    'days_old': days_old,
-                    'link': apply_link,
-                    'category': category,
-                    'found_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-                }
-                
-                # Check if matches preferences
-                if matches_preferences(internship_data, config):
-                    new_internships.append(internship_data)
-                    seen_ids.append(internship_id)
-                    print(f"  ✅ New: {title} at {company} - {location}")
-                else:
-                    # Still mark as seen but don't notify
-                    seen_ids.append(internship_id)
-                
+                store.save(content, job['url'], job['source'].name, job['category'])
             except Exception as e:
-                continue
-        
-        return new_internships
-        
-    except requests.exceptions.RequestException as e:
-        print(f"❌ Network error for {category}: {e}")
-        return new_internships
-    except Exception as e:
-        print(f"❌ Unexpected error for {category}: {e}")
-        return new_internships
+                print(f"⚠️ Warning: could not snapshot {job['url']}: {e}")
+        yield job, content, error
+
+def iter_new_internships(pages, config, seen_ids, store=None, repost_index=None, stats=None, tracker=None):
+    """Chain the fetch -> (snapshot) -> parse -> dedupe -> extract -> match -> (repost) stages"""
+    if store is not None:
+        pages = snapshot_stage(pages, store)
+    cards = parse_stage(pages, stats)
+    cards = dedupe_stage(cards, seen_ids, tracker)
+    internships = recency_stage(extract_stage(cards), config, seen_ids, tracker)
+    internships = match_stage(internships, config, seen_ids, stats, tracker)
+    if repost_index is not None:
+        internships = repost_stage(internships, repost_index, config['repost_detection'].get('action', 'flag'))
+    return internships
+
+def load_repost_index(config):
+    """Open the repost index if repost detection is enabled in config.json"""
+    settings = config.get('repost_detection', {})
+    if not settings.get('enabled', False):
+        return None
+    return RepostIndex(
+        settings.get('index_path', 'data/repost_index.json'),
+        window_days=settings.get('window_days', 30),
+        threshold=settings.get('similarity', 0.8),
+    )
+
+def scrape_category(category, headers, config, seen_ids, source=None):
+    """Scrape a specific internship category"""
+    source = source or InternshalaSource()
+    session = create_session(headers)
+    limiter = RateLimiter(config.get('request_delay_seconds', 2))
+    jobs = ({'source': source, 'category': category, 'url': url}
+            for url in source.listing_urls(category, config))
+    pages = fetch_all(session, limiter, jobs, max_workers=1)
+    return list(iter_new_internships(pages, config, seen_ids))
+
+def build_sinks(config):
+    """Create the extra sinks enabled in config.json"""
+    sinks = []
+    if config.get('archive', False):
+        sinks.append(ArchiveSink(config.get('archive_path', 'data/archive.jsonl')))
+    feed = config.get('feed', {})
+    if feed.get('enabled', False):
+        sinks.append(FeedSink(feed.get('dir', 'data/feed'), max_items=feed.get('max_items', 200)))
+    return sinks
+
+def scrape_internshala(sinks=None, worker_id=None):
+    """
+    Scrape all configured sources for new internships.
 
-def scrape_internshala():
-    """Scrape Internshala for new internships across multiple categories"""
+    Listing pages from every source are fetched concurrently through one shared
+    session and per-host rate limiter, and each match streams into the sinks as
+    soon as it is parsed. Returns the matches collected for notification.
+    With a worker_id, only the categories leased to this worker are scraped.
+    """
     print("🔍 Starting Internshala scraper...")
     
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-        'Accept-Language': 'en-US,en;q=0.5',
-        'Accept-Encoding': 'gzip, deflate, br',
-        'Connection': 'keep-alive',
-        'Upgrade-Insecure-Requests': '1'
-    }
-    
     config = load_config()
     if not config:
         return []
     
-    # Get search categories from config
-    search_categories = config.get('search_categories', ['full-stack-development'])
-    
-    all_new_internships = []
+    sources = get_sources(config)
+    shards = [(source, category) for source in sources for category in source.categories(config)]
+    # Most productive categories first, so a time budget is spent where matches are
+    shards = prioritize_shards(shards, load_category_stats(), config.get('explore_rate', 0.1))
+    budget = config.get('run_budget_seconds')
+    deadline = time.monotonic() + budget if budget else None
+    leases = LeaseStore(config.get('state_db', 'data/state.db')) if worker_id else None
     seen_ids = load_seen_internships()
     
-    print(f"📋 Searching across {len(search_categories)} categories:")
-    for category in search_categories:
-        print(f"   • {category}")
+    print(f"📋 Searching across {len(shards)} categories:")
+    for source, category in shards:
+        print(f"   • {source.name}: {category}")
+    if leases is not None:
+        print(f"👷 Worker {worker_id} only scrapes the categories it manages to lease")
     print()
     
-    # Scrape each category
-    for category in search_categories:
-        category_internships = scrape_category(category, headers, config, seen_ids)
-        all_new_internships.extend(category_internships)
-        
-        # Add a small delay between requests to be polite
-        if category != search_categories[-1]:  # Don't delay after last category
-            import time
-            time.sleep(2)
+    session = create_session()
+    # Small delay between requests to the same host to be polite
+    limiter = RateLimiter(config.get('request_delay_seconds', 2))
+    held = {}
+    fetched = fetch_all(
+        session, limiter, iter_fetch_jobs(shards, config, leases, worker_id, deadline, held, seen_ids),
+        max_workers=config.get('max_concurrent_requests', 4),
+        queue_size=config.get('page_queue_size'),
+    )
+    pages = release_stage(fetched, leases, worker_id, held, seen_ids) if leases is not None else fetched
     
-    # Save updated seen internships
-    if seen_ids:
-        save_seen_internships(seen_ids)
+    store = SnapshotStore(config.get('snapshot_dir', 'data/snapshots')) if config.get('save_snapshots', False) else None
+    
+    repost_index = load_repost_index(config)
+    tracker = ChangeTracker() if config.get('change_detection', {}).get('enabled', False) else None
+    
+    stats = Counter()
+    
+    notifications = NotificationBuffer()
+    sinks = [notifications] + build_sinks(config) + list(sinks or [])
+    latency = config.get('latency', {})
+    if latency.get('enabled', True):
+        fetch = None
+        if latency.get('fetch_detail_pages', False):
+            fetch = lambda url: fetch_url(session, limiter, url)
+        sinks.append(LatencySink(sources={source.name: source for source in sources}, fetch=fetch))
+    try:
+        count = run_pipeline(iter_new_internships(pages, config, seen_ids, store, repost_index, stats, tracker), sinks)
+    finally:
+        # Stop the fetch workers before touching shared state
+        fetched.close()
+        # Save updated seen internships, even if the run was interrupted
+        if seen_ids:
+            save_seen_internships(seen_ids)
+        if repost_index is not None:
+            repost_index.save()
+        if tracker is not None:
+            tracker.save()
+        if leases is not None:
+            # Categories left unfinished by an interrupted run are free to take again
+            for lease in list(held):
+                leases.release(lease, worker_id)
+            leases.close()
     
-    print(f"\n📊 Summary: Found {len(all_new_internships)} new matching internships across all categories")
-    return all_new_internships
+    print(f"\n📊 Summary: Found {count} new matching internships across all categories")
+    if stats['updates']:
+        print(f"   (including {stats['updates']} known posting(s) that now match after an update)")
+    report_fetch_savings(stats, config)
+    update_category_stats(stats)
+    return notifications.internships
 
 if __name__ == "__main__":
     config = load_config()
@@ -0,0 +1,168 @@
+import argparse
+import gzip
+import hashlib
+import json
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from sources import SOURCES
+
+class SnapshotStore:
+    """
+    Compressed, content-addressed archive of fetched listing pages.
+
+    Page bodies live under objects/<first two hex chars>/<sha256>.html.gz, so an
+    unchanged page is stored once no matter how often it is fetched. Every fetch
+    appends a line to index/<YYYY-MM-DD>.jsonl recording what was fetched when.
+    """
+
+    def __init__(self, root='data/snapshots'):
+        self.root = Path(root)
+        self.objects_dir = self.root / 'objects'
+        self.index_dir = self.root / 'index'
+        self.objects_dir.mkdir(parents=True, exist_ok=True)
+        self.index_dir.mkdir(parents=True, exist_ok=True)
+
+    def object_path(self, digest):
+        return self.objects_dir / digest[:2] / f"{digest}.html.gz"
+
+    def save(self, content, url, source, category, fetched_at=None):
+        """Store a page body and record the fetch in the day's index"""
+        fetched_at = fetched_at or datetime.now()
+        digest = hashlib.sha256(content).hexdigest()
+
+        path = self.object_path(digest)
+        if not path.exists():
+            path.parent.mkdir(exist_ok=True)
+            tmp_path = path.with_suffix('.tmp')
+            with gzip.open(tmp_path, 'wb') as f:
+                f.write(content)
+            tmp_path.replace(path)
+
+        entry = {
+            'sha256': digest,
+            'url': url,
+            'source': source,
+            'category': category,
+            'fetched_at': fetched_at.strftime('%Y-%m-%d %H:%M:%S'),
+        }
+        index_path = self.index_dir / f"{fetched_at.strftime('%Y-%m-%d')}.jsonl"
+        with open(index_path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(entry) + '\n')
+        return digest
+
+    def load(self, digest):
+        """Return the raw body of a stored page"""
+        with gzip.open(self.object_path(digest), 'rb') as f:
+            return f.read()
+
+    def iter_entries(self, since, until):
+        """Yield index entries for fetches between two dates (inclusive)"""
+        day = since
+        while day <= until:
+            index_path = self.index_dir / f"{day.strftime('%Y-%m-%d')}.jsonl"
+            if index_path.exists():
+                with open(index_path, 'r', encoding='utf-8') as f:
+                    for line in f:
+                        if line.strip():
+                            yield json.loads(line)
+            day += timedelta(days=1)
+
+def _parse_snapshot(args):
+    """Worker: run the current parser over one stored page and return card dicts"""
+    root, entry = args
+    source_cls = SOURCES.get(entry['source'])
+    if source_cls is None:
+        return entry, []
+
+    source = source_cls()
+    content = SnapshotStore(root).load(entry['sha256'])
+    internships = []
+    for card in source.find_cards(source.parse_page(content)):
+        try:
+            internship_id = source.posting_id(card)
+            internship_data = source.parse_card(card, entry['category']) if internship_id else None
+        except Exception:
+            continue
+        if internship_data:
+            internship_data['id'] = internship_id
+            internship_data['found_at'] = entry['fetched_at']
+            internships.append(internship_data)
+    return entry, internships
+
+def reparse(since, until, workers=None, root='data/snapshots', archive=True, mark_seen=True, notify=False):
+    """
+    Re-run the current parser over every snapshot fetched between two dates.
+    Pages are parsed in parallel worker processes; postings that are new to the
+    seen-store and match preferences are added to the archive. With `notify`
+    they are also sent through the normal notification path. With
+    `mark_seen=False` the seen-store is left alone, so the next regular run
+    still notifies any recovered posting that is live.
+    """
+    # Imported here because scraper itself imports this module
+    from scraper import load_config, load_seen_internships, save_seen_internships, recency_stage, match_stage
+    from pipeline import ArchiveSink, NotificationBuffer, run_pipeline
+    from digest import dispatch_notifications
+
+    config = load_config()
+    if not config:
+        return 0
+
+    store = SnapshotStore(root)
+    seen_ids = load_seen_internships()
+    jobs = [(str(store.root), entry) for entry in store.iter_entries(since, until)]
+    print(f"🗂️ Re-parsing {len(jobs)} snapshot(s) from {since:%Y-%m-%d} to {until:%Y-%m-%d}")
+
+    def unseen(results):
+        for entry, internships in results:
+            print(f"   • {entry['fetched_at']} {entry['category']}: {len(internships)} cards")
+            for internship_data in internships:
+                if internship_data['id'] not in seen_ids:
+                    yield internship_data
+
+    notifications = NotificationBuffer()
+    sinks = [notifications]
+    if archive:
+        sinks.append(ArchiveSink(config.get('archive_path', 'data/archive.jsonl')))
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        results = executor.map(_parse_snapshot, jobs, chunksize=4)
+        internships = recency_stage(unseen(results), config, seen_ids)
+        try:
+            count = run_pipeline(match_stage(internships, config, seen_ids), sinks)
+        finally:
+            if mark_seen:
+                save_seen_internships(seen_ids)
+
+    print(f"\n📊 Recovered {count} matching internship(s) from snapshots")
+    if notify:
+        status = dispatch_notifications(notifications.internships, config)
+        print(f"📧 Notification status: {status}")
+    elif count and not mark_seen:
+        print("ℹ️ Seen-store not updated: the next regular run will notify any that are still listed")
+    return count
+
+def _parse_date(value):
+    return datetime.strptime(value, '%Y-%m-%d')
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Raw HTML snapshot archive tools")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    reparse_parser = subparsers.add_parser('reparse', help="Re-parse stored snapshots with the current parser")
+    reparse_parser.add_argument('--since', type=_parse_date, required=True, help="First day to re-parse (YYYY-MM-DD)")
+    reparse_parser.add_argument('--until', type=_parse_date, default=None, help="Last day to re-parse (default: today)")
+    reparse_parser.add_argument('--workers', type=int, default=None, help="Parser processes (default: CPU count)")
+    reparse_parser.add_argument('--root', default='data/snapshots', help="Snapshot store directory")
+    reparse_parser.add_argument('--no-archive', action='store_true', help="Do not append recovered matches to the archive")
+    reparse_parser.add_argument('--no-seen', action='store_true',
+                                help="Leave the seen-store untouched so regular runs still notify recovered postings")
+    reparse_parser.add_argument('--notify', action='store_true',
+                                help="Send recovered matches through the normal email/digest notification path")
+
+    args = parser.parse_args()
+    if args.command == 'reparse':
+        until = args.until or datetime.now()
+        reparse(args.since, until, workers=args.workers, root=args.root,
+                archive=not args.no_archive, mark_seen=not args.no_seen, notify=args.notify)
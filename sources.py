@@ -0,0 +1,288 @@
+import json
+import re
+from datetime import datetime
+
+from bs4 import BeautifulSoup
+
+class Source:
+    """
+    Base class for a job board adapter.
+
+    An adapter only knows how to build listing URLs for a category and how to
+    turn a fetched listing page into card dicts. Fetching, rate limiting,
+    de-duplication and preference matching are shared by the scraper so every
+    source runs through the same pipeline.
+    """
+    name = None
+    # Posting IDs are only unique within one board, so they are prefixed with
+    # the source name in the shared stores (seen-store, fingerprints, ...)
+    qualify_ids = True
+
+    def categories(self, config):
+        """Categories to search on this source"""
+        per_source = config.get('source_categories', {})
+        if self.name in per_source:
+            return per_source[self.name]
+        return config.get('search_categories', [])
+
+    def listing_urls(self, category, config):
+        """Return the listing page URLs to fetch for a category"""
+        raise NotImplementedError
+
+    def page_url(self, listing_url, page):
+        """URL of page `page` (1-based) of a listing, or None if the source does not paginate"""
+        return listing_url if page == 1 else None
+
+    def find_cards(self, soup):
+        """Return the card elements found on a parsed listing page"""
+        raise NotImplementedError
+
+    def card_id(self, card):
+        """Return the posting ID of a card element, or None"""
+        raise NotImplementedError
+
+    def posting_id(self, card):
+        """Store-wide ID of a card: the board's posting ID, namespaced by source name"""
+        internship_id = self.card_id(card)
+        if internship_id and self.qualify_ids:
+            return f"{self.name}:{internship_id}"
+        return internship_id
+
+    def parse_card(self, card, category):
+        """Extract a card dict from a card element, or None if it is unusable"""
+        raise NotImplementedError
+
+    def card_text(self, card):
+        """Raw visible text of a card element, used for cheap change detection"""
+        return card.get_text(' ', strip=True)
+
+    def parse_page(self, content):
+        """Parse raw listing page content into a soup"""
+        return BeautifulSoup(content, 'html.parser')
+
+    def posted_at_from_detail(self, content):
+        """
+        Return the posting time from a detail page as a naive local datetime,
+        using schema.org JobPosting datePosted markup. None if there is none.
+        """
+        soup = self.parse_page(content)
+        for script in soup.find_all('script', type='application/ld+json'):
+            try:
+                data = json.loads(script.string or '')
+            except ValueError:
+                continue
+            for item in data if isinstance(data, list) else [data]:
+                if isinstance(item, dict) and item.get('datePosted'):
+                    try:
+                        posted = datetime.fromisoformat(item['datePosted'].replace('Z', '+00:00'))
+                    except ValueError:
+                        continue
+                    if posted.tzinfo is not None:
+                        posted = posted.astimezone().replace(tzinfo=None)
+                    return posted
+        return None
+
+def _first_text(element, selectors, default=None):
+    """Return the text of the first selector that matches inside `element`"""
+    for tag, attrs in selectors:
+        found = element.find(tag, attrs)
+        if found:
+            return found.get_text(strip=True)
+    return default
+
+class InternshalaSource(Source):
+    """Adapter for internshala.com listing pages"""
+    name = 'internshala'
+    base_url = 'https://internshala.com'
+    # Bare IDs, so state saved before other sources existed still matches
+    qualify_ids = False
+
+    # Try different selectors based on Internshala's structure
+    container_selectors = [
+        ('div', {'class': 'individual_internship'}),
+        ('div', {'class': 'internship_meta'}),
+        ('div', {'id': re.compile(r'internship_')}),
+    ]
+    title_selectors = [
+        ('h3', {'class': re.compile(r'heading')}),
+        ('h3', {}),
+        ('h4', {'class': re.compile(r'profile|title')}),
+        ('a', {'class': re.compile(r'view_detail')}),
+    ]
+    company_selectors = [
+        ('p', {'class': re.compile(r'company')}),
+        ('div', {'class': re.compile(r'company')}),
+        ('span', {'class': re.compile(r'company')}),
+        ('a', {'class': re.compile(r'link_display_like_text')}),
+    ]
+    location_selectors = [
+        ('div', {'class': re.compile(r'location')}),
+        ('span', {'class': re.compile(r'location')}),
+        ('a', {'class': re.compile(r'location')}),
+    ]
+    stipend_selectors = [
+        ('span', {'class': re.compile(r'stipend')}),
+        ('div', {'class': re.compile(r'stipend')}),
+    ]
+    duration_selectors = [
+        ('div', {'class': re.compile(r'duration')}),
+        ('span', {'class': re.compile(r'duration')}),
+    ]
+    # Look for posting time - usually appears near the end of the internship card
+    # Common patterns: "Just now", "Few hours ago", "2 days ago", "1 week ago"
+    posting_time_selectors = [
+        ('span', {'class': re.compile(r'status-[a-z]+')}),  # status-success, etc.
+        ('div', {'class': re.compile(r'status')}),
+        ('span', {}),  # Generic span, will look for time patterns
+        ('div', {}),   # Generic div, will look for time patterns
+    ]
+
+    # Stipend filter values Internshala's listing URLs accept
+    stipend_filters = [2000, 4000, 6000, 8000, 10000]
+    wfh_names = {'work from home', 'work-from-home', 'wfh', 'remote'}
+    in_office_names = {'in-office', 'in office', 'office'}
+
+    def __init__(self):
+        self.ignored_modes = set()
+
+    def listing_urls(self, category, config):
+        if not config.get('server_side_filters', False):
+            return [f"{self.base_url}/internships/{category}-internship/"]
+        return self.filtered_urls(category, config)
+
+    def filtered_urls(self, category, config):
+        """
+        Build the narrowest set of filtered listing URLs for the configured
+        locations, work_mode and min_stipend. The matcher still runs on every
+        card, so filters are only ever looser than the client-side checks.
+        """
+        modes = set()
+        for mode in config.get('work_mode', []):
+            name = mode.lower().strip()
+            if name in self.wfh_names or name in self.in_office_names:
+                modes.add(name)
+            elif name and name not in self.ignored_modes:
+                # Unknown modes (e.g. "Hybrid") cannot be filtered on, so they must not narrow the URLs
+                self.ignored_modes.add(name)
+                print(f"⚠️ Warning: work_mode '{mode}' has no listing filter, ignoring it for server-side filters")
+        cities = []
+        location_wfh = location_office = False
+        for location in config.get('locations', []):
+            name = location.lower().strip()
+            if name in self.wfh_names:
+                location_wfh = True
+            elif name in self.in_office_names:
+                location_office = True
+            elif name:
+                slug = re.sub(r'[^a-z0-9]+', '-', name).strip('-')
+                if slug not in cities:
+                    cities.append(slug)
+
+        # Work-from-home cards only match a city list that names work from home
+        want_wfh = bool(modes & self.wfh_names) or location_wfh or (not modes and not cities)
+        want_office = (bool(modes & self.in_office_names) or location_office
+                       or (not modes and (bool(cities) or not location_wfh)))
+
+        paths = []
+        if want_office and not cities:
+            # No city list to narrow by: the broad listing already includes work from home
+            paths.append(f"{category}-internship")
+        else:
+            if want_office:
+                paths.append(f"{category}-internship-in-{','.join(cities)}")
+            if want_wfh:
+                paths.append(f"work-from-home-{category}-internships")
+
+        stipend_suffix = ""
+        usable = [amount for amount in self.stipend_filters if amount <= config.get('min_stipend', 0)]
+        if usable:
+            # Round down to a supported value so no matching card is filtered out
+            stipend_suffix = f"stipend-{usable[-1]}/"
+
+        urls = []
+        for path in paths:
+            url = f"{self.base_url}/internships/{path}/{stipend_suffix}"
+            if url not in urls:
+                urls.append(url)
+        return urls
+
+    def page_url(self, listing_url, page):
+        return listing_url if page == 1 else f"{listing_url}page-{page}/"
+
+    def find_cards(self, soup):
+        for tag, attrs in self.container_selectors:
+            containers = soup.find_all(tag, attrs)
+            if containers:
+                return containers
+        return []
+
+    def card_id(self, card):
+        internship_id = (
+            card.get('internshipid') or
+            card.get('data-internship-id') or
+            card.get('id', '').replace('internship_', '')
+        )
+
+        if not internship_id:
+            # Try to extract from any link
+            link = card.find('a', href=True)
+            if link and 'detail' in link['href']:
+                internship_id = link['href'].split('/')[-1].split('?')[0]
+
+        return internship_id or None
+
+    def posting_time(self, card):
+        """Find the relative posting time text on a card"""
+        for tag, attrs in self.posting_time_selectors:
+            for elem in card.find_all(tag, attrs, limit=20):
+                text = elem.get_text(strip=True).lower()
+                # Check if this contains time-related keywords
+                if any(keyword in text for keyword in ['ago', 'just now', 'hour', 'day', 'week', 'month']):
+                    # Exclude "early applicant" text
+                    if 'early applicant' not in text and 'be an early' not in text:
+                        return elem.get_text(strip=True)
+        return "Unknown"
+
+    def apply_link(self, card):
+        link_elem = card.find('a', href=True)
+        if not link_elem:
+            return ""
+        href = link_elem['href']
+        if href.startswith('http'):
+            return href
+        return f"{self.base_url}{href}" if href.startswith('/') else f"{self.base_url}/{href}"
+
+    def parse_card(self, card, category):
+        title = _first_text(card, self.title_selectors)
+        if not title:
+            return None
+
+        return {
+            'id': self.card_id(card),
+            'title': title,
+            'company': _first_text(card, self.company_selectors, "Not specified"),
+            'location': _first_text(card, self.location_selectors, "Location not specified"),
+            'stipend': _first_text(card, self.stipend_selectors, "Not disclosed"),
+            'duration': _first_text(card, self.duration_selectors, "Not specified"),
+            'posting_time': self.posting_time(card),
+            'link': self.apply_link(card),
+            'category': category,
+            'source': self.name,
+        }
+
+# Registry of available adapters, keyed by the name used in config.json "sources"
+SOURCES = {
+    InternshalaSource.name: InternshalaSource,
+}
+
+def get_sources(config):
+    """Instantiate the adapters enabled in config (defaults to Internshala only)"""
+    names = config.get('sources', [InternshalaSource.name])
+    sources = []
+    for name in names:
+        source_cls = SOURCES.get(name)
+        if source_cls is None:
+            print(f"⚠️ Warning: unknown source '{name}' in config.json, skipping")
+            continue
+        sources.append(source_cls())
+    return sources